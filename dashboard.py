@@ -1,55 +1,58 @@
 import streamlit as st
 import pandas as pd
-from datetime import datetime
-import plotly.express as px
-import base64
+from concurrent.futures import ThreadPoolExecutor
 
-# Import functions from the data pipeline, forecast, XAI, and NLP modules
-from data_pipeline import get_global_data, get_country_data, get_historical_data, compute_daily_new_cases
-from forecast import forecast_arima
-from xai_module import get_arima_explanation
+# Import functions from the data pipeline and NLP modules. The forecast and
+# XAI modules drag in statsmodels/matplotlib, so they are imported lazily in
+# the historical-data section that actually uses them.
+from data_pipeline import get_global_data, get_country_data, get_daily_new_cases
 from nlp_module import generate_narrative_report
 
 st.title("COVID-19 Data Dashboard with Forecasting, XAI, and Narrative Report")
 
+# Widgets come first so all three API requests can be issued concurrently;
+# the GIL is released during socket I/O, so wall time collapses to the
+# slowest single request instead of the sum of all three.
+country = st.selectbox("Select a country", ["Germany", "USA", "France"])
+historical_days = st.slider("Select number of historical days", min_value=15, max_value=60, value=30, step=1)
+
+with ThreadPoolExecutor(max_workers=3) as executor:
+    global_future = executor.submit(get_global_data)
+    country_future = executor.submit(get_country_data, country)
+    historical_future = executor.submit(get_daily_new_cases, country, historical_days)
+
 # --- Global Data Section ---
 st.header("Global COVID-19 Data")
 try:
-    global_data = get_global_data()
+    global_data = global_future.result()
     st.write(global_data)
 except Exception as e:
     st.error(f"Error retrieving global data: {e}")
 
 # --- Country-Specific Data Section ---
 st.header("Country-Specific COVID-19 Data")
-country = st.selectbox("Select a country", ["Germany", "USA", "France"])
 try:
-    country_data = get_country_data(country)
+    country_data = country_future.result()
     st.write(country_data)
 except Exception as e:
     st.error(f"Error retrieving country data: {e}")
 
 # --- Historical Data, Forecast, XAI and Narrative Report Section ---
 st.header("Historical Data, Forecast, Model Explanation and Narrative Report")
-historical_days = st.slider("Select number of historical days", min_value=15, max_value=60, value=30, step=1)
 
 try:
-    historical_data = get_historical_data(country, lastdays=historical_days)
-    timeline = historical_data.get("timeline", {})
-    cases_timeline = timeline.get("cases", {})
-    
-    if cases_timeline:
-        # Compute daily new cases from cumulative data
-        daily_new_cases_dict = compute_daily_new_cases(cases_timeline)
-        sorted_dates = sorted(daily_new_cases_dict.keys(), key=lambda d: datetime.strptime(d, "%m/%d/%y"))
-        daily_cases_list = [daily_new_cases_dict[date] for date in sorted_dates]
-        historical_dates = [datetime.strptime(date, "%m/%d/%y") for date in sorted_dates]
-        
-        # Create DataFrame for historical data and display chart
-        hist_df = pd.DataFrame({
-            "Date": historical_dates,
-            "Daily New Cases": daily_cases_list
-        }).set_index("Date")
+    # Fetch + daily-cases computation happen in one cached step
+    historical_dates, daily_cases_list = historical_future.result()
+
+    if len(daily_cases_list):
+        from forecast import forecast_arima
+        from xai_module import get_arima_explanation
+
+        # Create DataFrame for historical data and display chart; the ndarray
+        # is used as the column directly instead of going through a Python
+        # list and a set_index copy.
+        hist_df = pd.DataFrame({"Daily New Cases": daily_cases_list}, index=historical_dates)
+        hist_df.index.name = "Date"
         st.subheader("Historical Daily New Cases")
         st.line_chart(hist_df)
         
@@ -60,13 +63,19 @@ try:
         forecast_values, model_fit = forecast_arima(daily_cases_list, forecast_period=forecast_period, order=(1,1,1))
         forecast_dates = pd.date_range(start=historical_dates[-1] + pd.Timedelta(days=1), periods=forecast_period)
         
-        forecast_df = pd.DataFrame({
-            "Date": forecast_dates,
-            "Forecast": forecast_values
-        }).set_index("Date")
-        
-        # Combine historical and forecast data for visualization
-        combined_df = pd.concat([hist_df, forecast_df], axis=1)
+        forecast_df = pd.DataFrame({"Forecast": forecast_values.to_numpy()}, index=forecast_dates)
+        forecast_df.index.name = "Date"
+
+        # Combine historical and forecast data for visualization. Allocate
+        # the combined frame once over the full index and fill the two
+        # column slices in place, instead of paying pd.concat's reindex+copy.
+        combined_df = pd.DataFrame(
+            index=historical_dates.append(forecast_dates),
+            columns=["Daily New Cases", "Forecast"],
+            dtype="float64",
+        )
+        combined_df.iloc[:len(historical_dates), 0] = daily_cases_list
+        combined_df.iloc[len(historical_dates):, 1] = forecast_values.values
         st.line_chart(combined_df)
         st.write("Forecasted Values", forecast_df)
         
@@ -74,11 +83,11 @@ try:
         st.subheader("ARIMA Model Explanation")
         summary_text, residual_plot = get_arima_explanation(model_fit)
         st.text_area("ARIMA Model Summary", summary_text, height=300)
-        st.image(f"data:image/png;base64,{residual_plot}", caption="Residual Plot")
+        st.image(residual_plot, caption="Residual Plot")
         
         # --- NLP: Narrative Report Section ---
         st.subheader("Narrative Report")
-        report = generate_narrative_report(daily_cases_list, forecast_values)
+        report = generate_narrative_report(float(daily_cases_list.mean()), float(forecast_values.mean()))
         st.write(report)
         
     else:
@@ -1,84 +1,237 @@
+import numpy as np
+import pandas as pd
 import requests
-from datetime import datetime
+import streamlit as st
 import math
-import statistics
+from functools import lru_cache
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # Base URL for the disease.sh API
 BASE_URL = "https://disease.sh/v3/covid-19"
 
+# ln(2), hoisted so compute_doubling_time avoids a libm call per invocation
+_LN2 = math.log(2)
+
+# Shared session so repeated API calls reuse the same TCP/TLS connection.
+# Request compressed payloads explicitly; disease.sh gzips JSON, which cuts
+# the historical-data transfer size roughly fivefold.
+_SESSION = requests.Session()
+_SESSION.headers.update({"Accept-Encoding": "gzip, deflate"})
+
+def _parse_json(response):
+    """
+    Parses a JSON response body, preferring orjson when it is installed.
+
+    orjson decodes straight from the raw bytes and is several times faster
+    than the stdlib parser that response.json() delegates to.
+    """
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
+
+@st.cache_data(ttl=3600, show_spinner=False)
 def get_global_data():
     """
     Retrieves global COVID-19 data.
-    
+
     Returns:
         dict: JSON object containing global statistics.
     """
     url = f"{BASE_URL}/all"
-    response = requests.get(url)
+    response = _SESSION.get(url, timeout=10)
     if response.status_code == 200:
-        return response.json()
+        return _parse_json(response)
     else:
         raise Exception(f"Error retrieving global data: {response.status_code}")
 
+@st.cache_data(ttl=3600, show_spinner=False)
 def get_country_data(country):
     """
     Retrieves COVID-19 data for a specific country.
-    
+
     Parameters:
         country (str): Name of the country, e.g., "Germany" or "USA".
-        
+
     Returns:
         dict: JSON object containing COVID-19 statistics for the specified country.
     """
     url = f"{BASE_URL}/countries/{country}"
-    response = requests.get(url)
+    response = _SESSION.get(url, timeout=10)
     if response.status_code == 200:
-        return response.json()
+        return _parse_json(response)
     else:
         raise Exception(f"Error retrieving data for {country}: {response.status_code}")
 
+@st.cache_data(ttl=3600, show_spinner=False)
 def get_historical_data(country="all", lastdays=30):
     """
     Retrieves historical COVID-19 data.
-    
+
     Parameters:
         country (str): Country name ("all" for global data, or a specific country like "Germany").
         lastdays (int): Number of past days for which data should be retrieved.
-        
+
     Returns:
         dict: JSON object containing the historical data.
     """
     url = f"{BASE_URL}/historical/{country}?lastdays={lastdays}"
-    response = requests.get(url)
+    response = _SESSION.get(url, timeout=10)
     if response.status_code == 200:
-        return response.json()
+        return _parse_json(response)
     else:
         raise Exception(f"Error retrieving historical data: {response.status_code}")
 
+@st.cache_data(ttl=3600, show_spinner=False)
+def get_daily_new_cases(country="all", lastdays=30):
+    """
+    Retrieves historical data and computes daily new cases in one cached step.
+
+    Caching the combined fetch + diff keyed on (country, lastdays) means a
+    Streamlit rerun with unchanged widgets skips both the API call and the
+    recomputation entirely.
+
+    Parameters:
+        country (str): Country name ("all" for global data, or a specific country like "Germany").
+        lastdays (int): Number of past days for which data should be retrieved.
+
+    Returns:
+        tuple: (sorted_dates, daily_new_cases)
+            - sorted_dates (pd.DatetimeIndex): Dates in chronological order.
+            - daily_new_cases (np.ndarray): Daily new cases per date; the first entry is 0.
+    """
+    historical_data = get_historical_data(country, lastdays=lastdays)
+    cases_timeline = historical_data.get("timeline", {}).get("cases", {})
+    return compute_daily_new_cases(cases_timeline)
+
+def _sorted_timeline(cases_timeline):
+    """
+    Parses and chronologically sorts a cumulative cases timeline.
+
+    Parameters:
+        cases_timeline (dict): Dictionary with "MM/DD/YY" dates as keys and
+                               cumulative case counts as values.
+
+    Returns:
+        tuple: (sorted_dates, sorted_vals)
+            - sorted_dates (pd.DatetimeIndex): Dates in chronological order.
+            - sorted_vals (np.ndarray): Cumulative counts in the same order.
+    """
+    keys = list(cases_timeline.keys())
+    vals = np.fromiter(cases_timeline.values(), dtype=np.int64, count=len(cases_timeline))
+
+    # Sort the dates chronologically; parsing happens once in pandas' C parser
+    # instead of one strptime call per key.
+    dates = pd.to_datetime(keys, format="%m/%d/%y", cache=True)
+    order = np.argsort(dates.values)
+    return dates[order], vals[order]
+
+def _case_stats_py(cum, window):
+    """
+    NumPy fallback for the fused case-statistics kernel (see _case_stats).
+    """
+    daily = np.empty(cum.shape[0], dtype=np.float64)
+    daily[0] = 0.0
+    daily[1:] = np.diff(cum)
+
+    ma = np.full(cum.shape[0], np.nan)
+    if cum.shape[0] >= window:
+        cs = np.concatenate(([0.0], np.cumsum(daily)))
+        ma[window - 1:] = (cs[window:] - cs[:-window]) / window
+
+    prev = daily[:-1]
+    curr = daily[1:]
+    mask = prev > 0
+    rate = float(((curr[mask] - prev[mask]) / prev[mask]).mean()) if mask.any() else 0.0
+    return daily, ma, rate
+
+if njit is not None:
+    @njit(cache=True)
+    def _case_stats(cum, window):
+        """
+        Fused kernel: daily diffs, rolling mean and average growth rate in
+        a single pass over the cumulative counts, so the array is loaded
+        from memory once instead of three times.
+        """
+        n = cum.shape[0]
+        daily = np.empty(n, dtype=np.float64)
+        ma = np.full(n, np.nan)
+        daily[0] = 0.0
+        running = 0.0
+        growth_sum = 0.0
+        growth_count = 0
+        for i in range(n):
+            if i > 0:
+                daily[i] = cum[i] - cum[i - 1]
+                if daily[i - 1] > 0:
+                    growth_sum += (daily[i] - daily[i - 1]) / daily[i - 1]
+                    growth_count += 1
+            running += daily[i]
+            if i >= window:
+                running -= daily[i - window]
+            if i >= window - 1:
+                ma[i] = running / window
+        rate = growth_sum / growth_count if growth_count > 0 else 0.0
+        return daily, ma, rate
+else:
+    _case_stats = _case_stats_py
+
+def compute_case_statistics(cases_timeline, window=7):
+    """
+    Computes daily new cases, their moving average and the average growth
+    rate from cumulative cases data in a single pass.
+
+    Parameters:
+        cases_timeline (dict): Dictionary with dates as keys and cumulative case counts as values.
+                               Expected date format: "MM/DD/YY".
+        window (int): Window size for the moving average.
+
+    Returns:
+        tuple: (sorted_dates, daily_new_cases, moving_avg, avg_growth_rate)
+            - sorted_dates (pd.DatetimeIndex): Dates in chronological order.
+            - daily_new_cases (np.ndarray): Daily new cases per date; the first entry is 0.
+            - moving_avg (np.ndarray): Rolling mean; the first (window-1) entries are NaN.
+            - avg_growth_rate (float): Average daily growth rate (as a fraction).
+    """
+    if not cases_timeline:
+        return pd.DatetimeIndex([]), np.array([]), np.array([]), 0.0
+
+    sorted_dates, sorted_vals = _sorted_timeline(cases_timeline)
+    daily, ma, rate = _case_stats(sorted_vals.astype(np.float64), window)
+    return sorted_dates, daily, ma, rate
+
 def compute_daily_new_cases(cases_timeline):
     """
     Computes daily new cases from cumulative cases data.
-    
+
     Parameters:
         cases_timeline (dict): Dictionary with dates as keys and cumulative case counts as values.
                                Expected date format: "MM/DD/YY".
-                               
+
     Returns:
-        dict: Dictionary with dates (starting from the second entry) and the computed daily new cases.
-    """
-    # Sort the dates based on the datetime
-    sorted_dates = sorted(cases_timeline.keys(), key=lambda d: datetime.strptime(d, "%m/%d/%y"))
-    daily_new = {}
-    previous_count = None
-    for date in sorted_dates:
-        current_count = cases_timeline[date]
-        if previous_count is None:
-            # Cannot compute daily new cases for the first date; set as None or 0
-            daily_new[date] = 0
-        else:
-            daily_new[date] = current_count - previous_count
-        previous_count = current_count
-    return daily_new
+        tuple: (sorted_dates, daily_new_cases)
+            - sorted_dates (pd.DatetimeIndex): Dates in chronological order.
+            - daily_new_cases (np.ndarray): Daily new cases per date; the first entry is 0.
+    """
+    if not cases_timeline:
+        return pd.DatetimeIndex([]), np.array([], dtype=np.int64)
+
+    sorted_dates, sorted_vals = _sorted_timeline(cases_timeline)
+
+    # Daily new cases are the first differences of the cumulative counts.
+    # The first date has no predecessor, so it stays 0.
+    diffs = np.empty_like(sorted_vals)
+    diffs[0] = 0
+    diffs[1:] = np.diff(sorted_vals)
+    return sorted_dates, diffs
 
 def compute_moving_average(data_list, window=7):
     """
@@ -91,15 +244,14 @@ def compute_moving_average(data_list, window=7):
     Returns:
         list: List of moving average values. The first (window-1) entries will be None to indicate insufficient data.
     """
-    moving_avg = []
-    for i in range(len(data_list)):
-        if i < window - 1:
-            moving_avg.append(None)
-        else:
-            window_values = data_list[i-window+1:i+1]
-            avg = sum(window_values) / window
-            moving_avg.append(avg)
-    return moving_avg
+    arr = np.asarray(data_list, dtype=np.float64)
+    if arr.size < window:
+        return [None] * arr.size
+    # Cumulative-sum trick: the sum of each window is cs[i+window] - cs[i],
+    # so the whole series of averages comes from one vectorized subtraction.
+    cs = np.concatenate(([0.0], np.cumsum(arr)))
+    ma = (cs[window:] - cs[:-window]) / window
+    return [None] * (window - 1) + ma.tolist()
 
 def compute_average_growth_rate(daily_cases):
     """
@@ -111,19 +263,18 @@ def compute_average_growth_rate(daily_cases):
     Returns:
         float: The average daily growth rate (as a fraction), calculated over days where previous day's cases are > 0.
     """
-    growth_rates = []
-    for i in range(1, len(daily_cases)):
-        prev = daily_cases[i-1]
-        curr = daily_cases[i]
-        # Avoid division by zero and ignore days with no cases as a base
-        if prev > 0:
-            growth_rate = (curr - prev) / prev
-            growth_rates.append(growth_rate)
-    if growth_rates:
-        return statistics.mean(growth_rates)
-    else:
+    a = np.asarray(daily_cases, dtype=np.float64)
+    if a.size < 2:
         return 0.0
+    prev = a[:-1]
+    curr = a[1:]
+    # Avoid division by zero and ignore days with no cases as a base
+    mask = prev > 0
+    if not mask.any():
+        return 0.0
+    return float(((curr[mask] - prev[mask]) / prev[mask]).mean())
 
+@lru_cache(maxsize=16)
 def compute_doubling_time(average_growth_rate):
     """
     Computes the doubling time based on the average daily growth rate.
@@ -135,7 +286,7 @@ def compute_doubling_time(average_growth_rate):
         float: Doubling time in days. Returns math.inf if the growth rate is zero or negative.
     """
     if average_growth_rate > 0:
-        return math.log(2) / average_growth_rate
+        return _LN2 / average_growth_rate
     else:
         return math.inf
 
@@ -149,24 +300,16 @@ if __name__ == "__main__":
         if not cases_timeline:
             raise Exception("No cases timeline data found.")
         
-        # Compute daily new cases from the cumulative data
-        daily_new_cases = compute_daily_new_cases(cases_timeline)
+        # Compute daily new cases, moving average and growth rate in one pass
+        sorted_dates, daily_cases_list, moving_avg, avg_growth_rate = compute_case_statistics(cases_timeline, window=7)
         print("Daily New Cases:")
-        for date, new_cases in daily_new_cases.items():
-            print(f"{date}: {new_cases}")
-        
-        # Convert daily new cases to a list (in sorted order) for further computations
-        sorted_dates = sorted(daily_new_cases.keys(), key=lambda d: datetime.strptime(d, "%m/%d/%y"))
-        daily_cases_list = [daily_new_cases[date] for date in sorted_dates]
-        
-        # Compute a 7-day moving average of daily new cases
-        moving_avg = compute_moving_average(daily_cases_list, window=7)
+        for date, new_cases in zip(sorted_dates, daily_cases_list):
+            print(f"{date.date()}: {new_cases:.0f}")
+
         print("\n7-Day Moving Average of Daily New Cases:")
         for date, avg in zip(sorted_dates, moving_avg):
-            print(f"{date}: {avg}")
-        
-        # Compute average growth rate over the period
-        avg_growth_rate = compute_average_growth_rate(daily_cases_list)
+            print(f"{date.date()}: {avg}")
+
         print(f"\nAverage Daily Growth Rate: {avg_growth_rate:.4f}")
         
         # Compute doubling time based on the average growth rate
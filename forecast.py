@@ -1,34 +1,109 @@
 import numpy as np
 import pandas as pd
+import streamlit as st
 import matplotlib.pyplot as plt
-from datetime import datetime
 from statsmodels.tsa.arima.model import ARIMA
 
+try:
+    from statsforecast.models import AutoARIMA
+except ImportError:
+    AutoARIMA = None
+
 # Import functions from the data pipeline module
 from data_pipeline import get_historical_data, compute_daily_new_cases
 
+class _AutoARIMASummary:
+    """Minimal stand-in for statsmodels' Summary, exposing as_text()."""
+
+    def __init__(self, text):
+        self._text = text
+
+    def as_text(self):
+        return self._text
+
+class _AutoARIMAFit:
+    """
+    Adapter wrapping a fitted statsforecast AutoARIMA so it exposes the
+    statsmodels-style surface (forecast/resid/summary) that the dashboard
+    and xai_module expect.
+    """
+
+    def __init__(self, model, series):
+        self._model = model
+        self._series = series
+
+    def forecast(self, steps):
+        return pd.Series(self._model.predict(h=steps)["mean"])
+
+    @property
+    def resid(self):
+        residuals = self._model.model_.get("residuals")
+        if residuals is None:
+            residuals = self._series - self._model.predict_in_sample()["fitted"]
+        return pd.Series(residuals)
+
+    def summary(self):
+        fit = self._model.model_
+        lines = ["AutoARIMA Model Results (statsforecast)", "=" * 40]
+        arma = fit.get("arma")
+        if arma is not None:
+            lines.append(f"ARMA specification: {arma}")
+        coef = fit.get("coef") or {}
+        for name, value in coef.items():
+            lines.append(f"{name:<12} {value: .4f}")
+        for key in ("aic", "aicc", "bic", "sigma2"):
+            if fit.get(key) is not None:
+                lines.append(f"{key.upper():<12} {fit[key]: .4f}")
+        return _AutoARIMASummary("\n".join(lines))
+
+@st.cache_resource(show_spinner=False)
+def _fit_arima(daily_cases, order):
+    """
+    Fits an ARIMA model to the daily new cases data, caching the fitted model.
+
+    The fit is cached across Streamlit reruns, so changing the forecast
+    horizon reuses the expensive MLE optimization instead of refitting.
+    When statsforecast is installed, its Numba-jitted AutoARIMA is used
+    (it selects the order itself, so `order` only applies to the
+    statsmodels fallback).
+
+    Parameters:
+        daily_cases (tuple): Daily new cases as a tuple (hashable for caching).
+        order (tuple): The (p, d, q) order for the statsmodels fallback.
+
+    Returns:
+        A fitted model exposing forecast(steps), resid and summary().
+    """
+    if AutoARIMA is not None:
+        series = np.asarray(daily_cases, dtype=np.float64)
+        model = AutoARIMA(season_length=1)
+        model.fit(series)
+        return _AutoARIMAFit(model, series)
+
+    # Build the Series from a float64 ndarray so statsmodels never sees an
+    # object-dtype column; its state-space filter runs in double precision.
+    series = pd.Series(np.asarray(daily_cases, dtype=np.float64))
+    model = ARIMA(series, order=order)
+    return model.fit()
+
 def forecast_arima(daily_cases, forecast_period=7, order=(1,1,1)):
     """
     Fits an ARIMA model to the daily new cases data and forecasts future values.
-    
+
     Parameters:
         daily_cases (list): List of daily new cases (numerical values).
         forecast_period (int): Number of days to forecast.
         order (tuple): The (p, d, q) order of the ARIMA model.
-        
+
     Returns:
         forecast (pd.Series): Forecasted daily new cases for the specified period.
     """
-    # Convert the list of daily cases into a pandas Series
-    series = pd.Series(daily_cases)
-    
-    # Fit the ARIMA model with the specified order
-    model = ARIMA(series, order=order)
-    model_fit = model.fit()
-    
+    # Fit (or reuse the cached fit for) the ARIMA model with the specified order
+    model_fit = _fit_arima(tuple(daily_cases), order)
+
     # Forecast the next forecast_period days
     forecast_result = model_fit.forecast(steps=forecast_period)
-    
+
     return forecast_result, model_fit
 
 if __name__ == "__main__":
@@ -41,12 +116,8 @@ if __name__ == "__main__":
         if not cases_timeline:
             raise Exception("No cases timeline data found.")
 
-        # Compute daily new cases from the cumulative cases data
-        daily_new_cases_dict = compute_daily_new_cases(cases_timeline)
-
-        # Sort dates to create a time-ordered list of daily new cases
-        sorted_dates = sorted(daily_new_cases_dict.keys(), key=lambda d: datetime.strptime(d, "%m/%d/%y"))
-        daily_cases_list = [daily_new_cases_dict[date] for date in sorted_dates]
+        # Compute daily new cases from the cumulative cases data (already sorted)
+        sorted_dates, daily_cases_list = compute_daily_new_cases(cases_timeline)
 
         print("Historical Daily New Cases:")
         print(daily_cases_list)
@@ -59,11 +130,10 @@ if __name__ == "__main__":
         print(forecast_values)
 
         # Optional: Plot the historical data and forecast
-        dates = [datetime.strptime(d, "%m/%d/%y") for d in sorted_dates]
-        forecast_dates = pd.date_range(start=dates[-1] + pd.Timedelta(days=1), periods=forecast_period)
+        forecast_dates = pd.date_range(start=sorted_dates[-1] + pd.Timedelta(days=1), periods=forecast_period)
 
         plt.figure(figsize=(10, 5))
-        plt.plot(dates, daily_cases_list, label='Historical Daily New Cases')
+        plt.plot(sorted_dates, daily_cases_list, label='Historical Daily New Cases')
         plt.plot(forecast_dates, forecast_values, label='Forecast', linestyle='--', marker='o')
         plt.xlabel("Date")
         plt.ylabel("Daily New Cases")
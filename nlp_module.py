@@ -1,19 +1,17 @@
-def generate_narrative_report(daily_cases, forecast_values):
+def generate_narrative_report(avg_daily_cases, forecast_avg):
     """
     Generates a narrative report summarizing historical data and forecast.
-    
+
+    The caller passes the precomputed averages (the dashboard already has
+    the data as arrays), so no extra pass over the raw series is needed here.
+
     Parameters:
-        daily_cases (list): List of historical daily new cases.
-        forecast_values (pd.Series): Forecasted daily new cases.
-        
+        avg_daily_cases (float): Average historical daily new cases.
+        forecast_avg (float): Average forecasted daily new cases.
+
     Returns:
         str: A narrative report in natural language.
     """
-    # Calculate average historical daily new cases
-    avg_daily_cases = sum(daily_cases) / len(daily_cases)
-    # Calculate the average forecasted cases
-    forecast_avg = forecast_values.mean()
-    
     # Determine the trend by comparing forecasted average to historical average
     if forecast_avg < avg_daily_cases:
         trend = "decreasing"
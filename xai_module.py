@@ -1,6 +1,16 @@
+import matplotlib
+matplotlib.use("Agg")  # headless backend; avoids GUI initialization cost
 import matplotlib.pyplot as plt
 import io
-import base64
+
+# Cache of the last explanation, keyed on the identity of the fitted model.
+# The fit itself is cached across reruns (see forecast._fit_arima), so the
+# same model object comes back repeatedly and the summary/plot can be reused.
+_EXPLANATION_CACHE = {}
+
+# One figure, created at import time and redrawn in place on every call,
+# so each render skips figure allocation and pyplot's global state machinery.
+_FIG, _AX = plt.subplots(figsize=(8, 4))
 
 def get_arima_explanation(model_fit):
     """
@@ -12,26 +22,31 @@ def get_arima_explanation(model_fit):
     Returns:
         tuple: (summary_text, residual_plot)
             - summary_text (str): A text summary of the model's parameters.
-            - residual_plot (str): Base64-encoded PNG image of the residuals plot.
+            - residual_plot (bytes): PNG image of the residuals plot.
     """
+    cache_key = id(model_fit)
+    if cache_key in _EXPLANATION_CACHE:
+        return _EXPLANATION_CACHE[cache_key]
+
     # Get the model summary as text
     summary_text = model_fit.summary().as_text()
     
-    # Create a residual plot
+    # Draw the residual plot onto the reused figure
     residuals = model_fit.resid
-    fig, ax = plt.subplots(figsize=(8, 4))
-    ax.plot(residuals, marker='o', linestyle='-', color='tab:blue')
-    ax.set_title("ARIMA Model Residuals")
-    ax.set_xlabel("Time")
-    ax.set_ylabel("Residuals")
-    plt.tight_layout()
-    
-    # Save the plot to a buffer in PNG format
+    _AX.clear()
+    _AX.plot(residuals, marker='o', linestyle='-', color='tab:blue')
+    _AX.set_title("ARIMA Model Residuals")
+    _AX.set_xlabel("Time")
+    _AX.set_ylabel("Residuals")
+    _FIG.tight_layout()
+
+    # Save the plot to a buffer in PNG format; st.image accepts raw bytes
     buf = io.BytesIO()
-    plt.savefig(buf, format="png")
-    plt.close(fig)
-    buf.seek(0)
-    # Encode the image to base64 for easy integration in HTML or Streamlit
-    residual_plot = base64.b64encode(buf.read()).decode("utf-8")
-    
+    _FIG.savefig(buf, format="png", dpi=72)
+    residual_plot = buf.getvalue()
+
+    # Keep only the most recent explanation to avoid holding old models alive
+    _EXPLANATION_CACHE.clear()
+    _EXPLANATION_CACHE[cache_key] = (summary_text, residual_plot)
+
     return summary_text, residual_plot